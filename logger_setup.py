@@ -1,9 +1,28 @@
-import os
 import logging
+from logging.handlers import RotatingFileHandler
+
+def setup_logger(log_file: str = 'teleups.log') -> logging.Logger:
+    """
+    Returns the application logger, configuring its handlers on first use.
+
+    Logs go to the console and to a rotating file capped at 1 MiB with three
+    backups, so the disk footprint (and append latency) stays bounded no matter
+    how long the monitor runs. Repeated calls return the already-configured
+    logger unchanged.
+    """
+    logger = logging.getLogger('teleups')
+    if logger.handlers:
+        return logger
+
+    logger.setLevel(logging.INFO)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    logger.addHandler(stream_handler)
+
+    file_handler = RotatingFileHandler(log_file, maxBytes=1_048_576, backupCount=3)
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
 
-def setup_logger():
-    logging.basicConfig(level=logging.INFO,
-                        format='%(asctime)s - %(levelname)s - %(message)s',
-                        handlers=[logging.StreamHandler()])
-    logger = logging.getLogger(__name__)
     return logger
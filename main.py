@@ -5,26 +5,61 @@ from logger_setup import setup_logger
 from telegram_notifier import TelegramNotifier
 from ups_monitor import UPSMonitor
 from dotenv import load_dotenv
+from typing import NamedTuple
+import asyncio
 import os
 
-# Load environment variables from .env file
-load_dotenv()
+# Required environment variables, in Config field order.
+_ENV_KEYS = (
+    'TELEGRAM_TOKEN_ID',
+    'TELEGRAM_CHAT_ID',
+    'NUT_CLIENT_NAME',
+    'NUT_CLIENT_HOST',
+    'NUT_CLIENT_USER',
+    'NUT_CLIENT_PASSWORD',
+)
 
-# Configuration Constants
-TELEGRAM_TOKEN_ID = os.getenv('TELEGRAM_TOKEN_ID')
-TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
-NUT_CLIENT_NAME = os.getenv('NUT_CLIENT_NAME')
-NUT_CLIENT_HOST = os.getenv('NUT_CLIENT_HOST')
-NUT_CLIENT_USER = os.getenv('NUT_CLIENT_USER')
-NUT_CLIENT_PASSWORD = os.getenv('NUT_CLIENT_PASSWORD')
+class Config(NamedTuple):
+    """
+    Validated application settings read once from the environment.
+    """
+    telegram_token: str
+    telegram_chat: str
+    nut_name: str
+    nut_host: str
+    nut_user: str
+    nut_pass: str
 
-def main():
+def load_config() -> Config:
+    """
+    Reads and validates the required environment variables in one pass.
+
+    Values from a .env file are loaded first; variables already set in the
+    environment (e.g. by Docker or systemd) take precedence. Missing values
+    fail fast here instead of surfacing later as a confusing PyNUT or
+    Telegram error mid-run.
+
+    Raises:
+        RuntimeError: If any required environment variable is unset or empty.
+    """
+    load_dotenv()
+    values = [os.getenv(key) for key in _ENV_KEYS]
+    missing = [key for key, value in zip(_ENV_KEYS, values) if not value]
+    if missing:
+        raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
+    return Config(*values)
+
+async def main():
+    config = load_config()
     logger = setup_logger()
-    telegram_notifier = TelegramNotifier(token_id=TELEGRAM_TOKEN_ID, chat_id=TELEGRAM_CHAT_ID, logger=logger)
+    telegram_notifier = TelegramNotifier(token_id=config.telegram_token, chat_id=config.telegram_chat, logger=logger)
 
-    nut_client = NUTClient(NUT_CLIENT_NAME, NUT_CLIENT_HOST, NUT_CLIENT_USER, NUT_CLIENT_PASSWORD)
+    nut_client = NUTClient(config.nut_name, config.nut_host, config.nut_user, config.nut_pass)
     ups_monitor = UPSMonitor(nut_client, telegram_notifier, logger)
-    ups_monitor.monitor_ups()
+    try:
+        await ups_monitor.monitor_ups()
+    finally:
+        await telegram_notifier.close()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,8 +1,122 @@
+import time
+from functools import wraps
+from typing import Optional
+
 from PyNUTClient.PyNUT import PyNUTClient
 
+# Descriptions for the NUT status codes this monitor understands.
+_STATUS_MAP = {
+    'OL': 'On Line',
+    'OB': 'On Battery',
+    'LB': 'Low Battery',
+    'CHRG': 'Charging',
+    'DISCHRG': 'Discharging',
+    'BYPS': 'Bypass',
+    'OFF': 'Offline',
+    'TRIM': 'SmartTrim',
+    'BOOST': 'SmartBoost',
+}
+_STATUS_KEYS = frozenset(_STATUS_MAP)
+
+
+def _ttl_cached(method):
+    """
+    Caches the result of a NUT read method for `cache_ttl` seconds.
+
+    Redundant calls within the same monitoring tick (e.g. the vars fetches behind
+    `is_ups_battery_low` and `get_battery_charge_percentage`) return the cached decoded
+    dictionary instead of hitting the NUT daemon again. Entries are keyed by method name
+    and stored as `(timestamp, value)` pairs on the instance.
+
+    Args:
+    - method (callable): A NUTClient method returning a decoded dictionary.
+
+    Returns:
+    - callable: The wrapped method with TTL caching applied.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        now = time.monotonic()
+        entry = self._cache.get(method.__name__)
+        if entry is not None and now - entry[0] < self.cache_ttl:
+            return entry[1]
+        value = method(self, *args, **kwargs)
+        self._cache[method.__name__] = (now, value)
+        return value
+    return wrapper
+
+
+class NutConnectionPool:
+    """
+    Keeps an authenticated PyNUTClient connection alive between NUT operations.
+
+    PyNUTClient opens a socket and logs in on construction; rebuilding it per query
+    thrashes TCP and authentication for a loop that polls every couple of seconds.
+    The pool hands out a live client via `acquire` and takes it back via `release`,
+    so connection setup and LOGIN are amortized over many queries. A connection
+    left idle for longer than `max_idle` seconds is dropped on the next acquire
+    and replaced with a fresh one. One pooled connection is enough for this
+    monitor's sequential access pattern.
+    """
+
+    def __init__(self, ups_host, ups_login_user, ups_login_pass, max_idle: float = 30.0):
+        """
+        Initializes a NutConnectionPool instance.
+
+        Args:
+        - ups_host (str): Hostname or IP address of the NUT server.
+        - ups_login_user (str): Username for logging into the NUT server.
+        - ups_login_pass (str): Password for logging into the NUT server.
+        - max_idle (float): Seconds an idle connection is kept before being replaced.
+        """
+        self.ups_host = ups_host
+        self.max_idle = max_idle
+        self._login_user = ups_login_user
+        self._login_pass = ups_login_pass
+        self._client = None
+        self._released_at = 0.0
+
+    def acquire(self) -> PyNUTClient:
+        """
+        Returns a live, authenticated PyNUTClient, reusing the pooled connection if fresh.
+
+        Returns:
+        - PyNUTClient: A connected client; newly created if none was pooled or the
+                pooled one sat idle for longer than `max_idle`.
+        """
+        if self._client is not None and time.monotonic() - self._released_at > self.max_idle:
+            self.discard(self._client)
+        if self._client is None:
+            return PyNUTClient(host=self.ups_host, login=self._login_user, password=self._login_pass)
+        client, self._client = self._client, None
+        return client
+
+    def release(self, client: PyNUTClient) -> None:
+        """
+        Returns a healthy client to the pool for reuse.
+
+        Args:
+        - client (PyNUTClient): The client obtained from `acquire`.
+        """
+        self._client = client
+        self._released_at = time.monotonic()
+
+    def discard(self, client: PyNUTClient) -> None:
+        """
+        Drops a client whose connection is no longer trusted.
+
+        The reference is simply released; PyNUTClient sends LOGOUT and closes the
+        socket in its destructor. A fresh connection is built on the next `acquire`.
+
+        Args:
+        - client (PyNUTClient): The client to drop.
+        """
+        if client is self._client:
+            self._client = None
+
 
 class NUTClient:
-    def __init__(self, ups_name, ups_host, ups_login_user, ups_login_pass):
+    def __init__(self, ups_name, ups_host, ups_login_user, ups_login_pass, cache_ttl: float = 1.0):
         """
         Initializes a NUTClient instance.
 
@@ -11,9 +125,12 @@ class NUTClient:
         - ups_host (str): Hostname or IP address of the NUT server.
         - ups_login_user (str): Username for logging into the NUT server.
         - ups_login_pass (str): Password for logging into the NUT server.
+        - cache_ttl (float): How long, in seconds, NUT reads are served from cache.
         """
         self.ups_name = ups_name
-        self.client = PyNUTClient(host=ups_host, login=ups_login_user, password=ups_login_pass)
+        self.cache_ttl = cache_ttl
+        self._cache = {}
+        self._pool = NutConnectionPool(ups_host, ups_login_user, ups_login_pass)
 
     @staticmethod
     def __decode_byte_dict(byte_dict: dict) -> dict:
@@ -26,23 +143,36 @@ class NUTClient:
         Returns:
         - dict: Dictionary with decoded keys and values as strings.
         """
-        return {key.decode('utf-8'): value.decode('utf-8') for key, value in byte_dict.items()}
+        # Bind the unbound method once so the comprehension skips two attribute
+        # lookups per entry; this runs on every NUT read.
+        decode = bytes.decode
+        return {decode(key, 'utf-8'): decode(value, 'utf-8') for key, value in byte_dict.items()}
 
     def __handle_operation(self, operation, *args, **kwargs):
         """
         Handles common error handling for operations with the NUT client.
 
+        A connection is acquired from the pool for the duration of the operation and
+        released back on success; on error it is discarded so the next operation
+        reconnects with a clean socket.
+
         Args:
-        - operation (callable): Callable representing a method of PyNUTClient.
+        - operation (str): Name of a PyNUTClient method to invoke.
         - args: Positional arguments to pass to the operation.
         - kwargs: Keyword arguments to pass to the operation.
 
         Returns:
         - Any: Result of the operation, or None if an error occurs.
         """
+        client = None
         try:
-            return operation(*args, **kwargs)
+            client = self._pool.acquire()
+            result = getattr(client, operation)(*args, **kwargs)
+            self._pool.release(client)
+            return result
         except Exception as e:
+            if client is not None:
+                self._pool.discard(client)
             print(f"Error occurred: {e}")
             return None
 
@@ -53,8 +183,9 @@ class NUTClient:
         Returns:
         - bool: True if the UPS is available, False otherwise.
         """
-        return self.__handle_operation(self.client.CheckUPSAvailable, ups=self.ups_name)
+        return self.__handle_operation('CheckUPSAvailable', ups=self.ups_name)
 
+    @_ttl_cached
     def get_ups_read_write_vars(self) -> dict:
         """
         Retrieves read-write variables of the UPS device.
@@ -62,9 +193,10 @@ class NUTClient:
         Returns:
         - dict: Dictionary containing read-write variables of the UPS.
         """
-        response = self.__handle_operation(self.client.GetRWVars, ups=self.ups_name)
+        response = self.__handle_operation('GetRWVars', ups=self.ups_name)
         return self.__decode_byte_dict(response) if response else {}
 
+    @_ttl_cached
     def get_ups_vars(self) -> dict:
         """
         Retrieves variables of the UPS device.
@@ -72,9 +204,30 @@ class NUTClient:
         Returns:
         - dict: Dictionary containing variables of the UPS.
         """
-        response = self.__handle_operation(self.client.GetUPSVars, ups=self.ups_name)
+        response = self.__handle_operation('GetUPSVars', ups=self.ups_name)
         return self.__decode_byte_dict(response) if response else {}
 
+    @_ttl_cached
+    def _get_raw_ups_vars(self) -> dict:
+        """
+        Retrieves variables of the UPS device without decoding them.
+
+        Returns:
+        - dict: Raw byte-encoded variables as returned by PyNUT.
+        """
+        response = self.__handle_operation('GetUPSVars', ups=self.ups_name)
+        return response if response else {}
+
+    def _get_raw_status(self) -> bytes:
+        """
+        Retrieves just the raw 'ups.status' value, skipping the full-dict decode.
+
+        Returns:
+        - bytes: The raw status value, or b'' if it is not available.
+        """
+        return self._get_raw_ups_vars().get(b'ups.status', b'')
+
+    @_ttl_cached
     def get_ups_list(self) -> dict:
         """
         Retrieves the list of UPS devices connected to the NUT server.
@@ -82,35 +235,113 @@ class NUTClient:
         Returns:
         - dict: Dictionary containing the list of UPS devices.
         """
-        response = self.__handle_operation(self.client.GetUPSList)
+        response = self.__handle_operation('GetUPSList')
         return self.__decode_byte_dict(response) if response else {}
 
-    def get_current_power_draw(self) -> int:
+    @staticmethod
+    def _power_draw(ups_vars: dict) -> int:
+        """
+        Extracts the current power draw in watts from a pre-fetched vars dictionary.
+
+        Args:
+        - ups_vars (dict): Decoded UPS variables, as returned by `get_ups_vars`.
+
+        Returns:
+        - int: The current power draw from the UPS in watts. Returns 0 if the value is not available.
+        """
+        return int(ups_vars.get('ups.realpower', '0')) if ups_vars else 0
+
+    @staticmethod
+    def _battery_pct(ups_vars: dict) -> int:
+        """
+        Extracts the battery charge percentage from a pre-fetched vars dictionary.
+
+        Args:
+        - ups_vars (dict): Decoded UPS variables, as returned by `get_ups_vars`.
+
+        Returns:
+        - int: Current battery charge percentage. Returns 0 if the value is not available.
+        """
+        return int(ups_vars.get('battery.charge', 0)) if ups_vars else 0
+
+    @staticmethod
+    def _on_battery(ups_vars: dict) -> bool:
+        """
+        Checks a pre-fetched vars dictionary for the 'OB' (on battery) status flag.
+
+        Args:
+        - ups_vars (dict): Decoded UPS variables, as returned by `get_ups_vars`.
+
+        Returns:
+        - bool: True if the UPS is on battery power ('OB' status), False otherwise.
+        """
+        return 'OB' in ups_vars.get('ups.status', '') if ups_vars else False
+
+    @staticmethod
+    def _battery_low(ups_vars: dict, ups_rwvars: dict) -> bool:
+        """
+        Compares the battery charge against the low threshold using pre-fetched dictionaries.
+
+        Args:
+        - ups_vars (dict): Decoded UPS variables, as returned by `get_ups_vars`.
+        - ups_rwvars (dict): Decoded read-write variables, as returned by `get_ups_read_write_vars`.
+
+        Returns:
+        - bool: True if the battery charge is below or equal to the low threshold, False otherwise.
+        """
+        battery_pct = NUTClient._battery_pct(ups_vars)
+        low_pct = int(ups_rwvars.get('battery.charge.low', 0)) if ups_rwvars else 0
+        return battery_pct <= low_pct
+
+    @staticmethod
+    def _is_battery_low_from(ups_vars: dict, ups_rwvars: dict, ignore_ob: bool = False) -> bool:
+        """
+        Evaluates the low-battery check against pre-fetched dictionaries.
+
+        Args:
+        - ups_vars (dict): Decoded UPS variables, as returned by `get_ups_vars`.
+        - ups_rwvars (dict): Decoded read-write variables, as returned by `get_ups_read_write_vars`.
+        - ignore_ob (bool): If True, skip the on-battery precondition. Defaults to False.
+
+        Returns:
+        - bool: True if the battery charge is below or equal to the low threshold, False otherwise.
+        """
+        if not NUTClient._on_battery(ups_vars) and not ignore_ob:
+            return False
+        return NUTClient._battery_low(ups_vars, ups_rwvars)
+
+    def get_current_power_draw(self, ups_vars: Optional[dict] = None) -> int:
         """
         Retrieves the current power being drawn from the UPS in watts.
 
-        This method accesses the UPS variables using the `get_ups_vars` method and retrieves the 
-        value of the 'ups.realpower' key, which represents the current power draw in watts. If the 
-        'ups.realpower' key is not present in the dictionary, it defaults to '0'. The value is then 
-        converted to an integer and returned.
+        This method accesses the UPS variables and retrieves the value of the 'ups.realpower'
+        key, which represents the current power draw in watts. If the 'ups.realpower' key is
+        not present in the dictionary, it defaults to '0'. The value is then converted to an
+        integer and returned.
+
+        Args:
+        - ups_vars (Optional[dict]): A pre-fetched vars snapshot to read from.
+                Fetched from the NUT server if not provided.
 
         Returns:
             int: The current power draw from the UPS in watts. Returns 0 if the value is not available.
         """
-        ups_vars = self.get_ups_vars()
-        return int(ups_vars.get('ups.realpower', '0'))
+        return self._power_draw(ups_vars if ups_vars is not None else self.get_ups_vars())
 
-    def get_battery_charge_percentage(self) -> int:
+    def get_battery_charge_percentage(self, ups_vars: Optional[dict] = None) -> int:
         """
         Retrieves the current battery charge percentage of the UPS device.
 
+        Args:
+        - ups_vars (Optional[dict]): A pre-fetched vars snapshot to read from.
+                Fetched from the NUT server if not provided.
+
         Returns:
         - int: Current battery charge percentage.
         """
-        ups_vars = self.get_ups_vars()
-        return int(ups_vars.get('battery.charge', 0)) if ups_vars else 0
+        return self._battery_pct(ups_vars if ups_vars is not None else self.get_ups_vars())
 
-    def get_battery_charge_low_percentage(self) -> int:
+    def get_battery_charge_low_percentage(self, ups_rwvars: Optional[dict] = None) -> int:
         """
         Retrieves the low battery charge percentage threshold from the UPS's read/write variables.
 
@@ -118,24 +349,35 @@ class NUTClient:
         which indicates the battery charge percentage at which the UPS considers the battery to be low.
         If the value is not found or if an error occurs while accessing the variables, it returns 0.
 
+        Args:
+        - ups_rwvars (Optional[dict]): A pre-fetched read-write vars snapshot to read from.
+                Fetched from the NUT server if not provided.
+
         Returns:
             int: The battery charge low percentage threshold. Returns 0 if the value is not available or
                 if an error occurs.
         """
-        ups_rwvars = self.get_ups_read_write_vars()
+        if ups_rwvars is None:
+            ups_rwvars = self.get_ups_read_write_vars()
         return int(ups_rwvars.get('battery.charge.low', 0)) if ups_rwvars else 0
 
-    def is_ups_on_battery(self) -> bool:
+    def is_ups_on_battery(self, ups_vars: Optional[dict] = None) -> bool:
         """
         Checks if the UPS device is currently running on battery power.
 
+        Args:
+        - ups_vars (Optional[dict]): A pre-fetched vars snapshot to read from.
+                The raw status is fetched from the NUT server if not provided.
+
         Returns:
         - bool: True if the UPS is on battery power ('OB' status), False otherwise.
         """
-        ups_vars = self.get_ups_vars()
-        return 'OB' in ups_vars.get('ups.status') if ups_vars else False
+        if ups_vars is not None:
+            return self._on_battery(ups_vars)
+        return b'OB' in self._get_raw_status().split()
 
-    def is_ups_battery_low(self, ignore_ob: bool = False) -> bool:
+    def is_ups_battery_low(self, ignore_ob: bool = False, ups_vars: Optional[dict] = None,
+                           ups_rwvars: Optional[dict] = None) -> bool:
         """
         Checks if the UPS battery charge is below the configured low battery threshold.
 
@@ -148,17 +390,27 @@ class NUTClient:
             ignore_ob (bool): If True, the method will ignore whether the UPS is on battery power and will
                             only compare the battery charge percentage with the low battery threshold.
                             Defaults to False.
+            ups_vars (Optional[dict]): A pre-fetched vars snapshot to read from. Fetched from the
+                            NUT server if not provided.
+            ups_rwvars (Optional[dict]): A pre-fetched read-write vars snapshot to read from.
+                            Fetched from the NUT server if not provided.
 
         Returns:
             bool: True if the UPS battery charge is below or equal to the low battery threshold, False otherwise.
         """
-        if not self.is_ups_on_battery() and not ignore_ob:
-            return False
-        return self.get_battery_charge_percentage() <= self.get_battery_charge_low_percentage()
+        if ups_vars is None:
+            ups_vars = self.get_ups_vars()
+        if ups_rwvars is None:
+            ups_rwvars = self.get_ups_read_write_vars()
+        return self._is_battery_low_from(ups_vars, ups_rwvars, ignore_ob)
 
-    def get_ups_status(self) -> str:
+    @staticmethod
+    def _status(ups_vars: dict) -> str:
         """
-        Retrieves the descriptive status of the UPS device.
+        Maps the status codes in a pre-fetched vars dictionary to their descriptions.
+
+        Args:
+        - ups_vars (dict): Decoded UPS variables, as returned by `get_ups_vars`.
 
         Returns:
         - str: Description of the current status of the UPS device.
@@ -173,28 +425,23 @@ class NUTClient:
                 - 'TRIM': SmartTrim (UPS is trimming the voltage)
                 - 'BOOST': SmartBoost (UPS is boosting the voltage)
         """
-        status_map = {
-            'OL': 'On Line',
-            'OB': 'On Battery',
-            'LB': 'Low Battery',
-            'CHRG': 'Charging',
-            'DISCHRG': 'Discharging',
-            'BYPS': 'Bypass',
-            'OFF': 'Offline',
-            'TRIM': 'SmartTrim',
-            'BOOST': 'SmartBoost',
-        }
-
-        ups_vars = self.get_ups_vars()
-        if ups_vars:
-            status_codes = ups_vars.get('ups.status', '').split()
-            status_descriptions = [status_map.get(code, 'Unknown status') for code in status_codes]
-
-            # Filter out 'Unknown status' if at least one known status is detected
-            known_statuses = [desc for desc in status_descriptions if desc != 'Unknown status']
-            if known_statuses:
-                return ', '.join(known_statuses)
-            else:
-                return 'Unknown status'
-        else:
+        if not ups_vars:
             return 'Unknown status'
+        status_codes = ups_vars.get('ups.status', '').split()
+        # Unknown codes are skipped in a single pass; the fallback only applies
+        # when no known status is detected at all.
+        return ', '.join(_STATUS_MAP[code] for code in status_codes if code in _STATUS_KEYS) or 'Unknown status'
+
+    def get_ups_status(self, ups_vars: Optional[dict] = None) -> str:
+        """
+        Retrieves the descriptive status of the UPS device.
+
+        Args:
+        - ups_vars (Optional[dict]): A pre-fetched vars snapshot to read from.
+                Fetched from the NUT server if not provided.
+
+        Returns:
+        - str: Description of the current status of the UPS device. See `_status` for the
+                possible status descriptions.
+        """
+        return self._status(ups_vars if ups_vars is not None else self.get_ups_vars())
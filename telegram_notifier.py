@@ -1,12 +1,54 @@
-import requests
+import asyncio
+import aiohttp
 import logging
+import time
 from typing import Optional
 
+# Fallback logger resolved once at import so each notifier instance does not
+# repeat the getLogger lookup.
+_LOG = logging.getLogger(__name__)
+
+class _TokenBucket:
+    """
+    An asyncio token bucket that refills `capacity` tokens every `period` seconds.
+    """
+
+    def __init__(self, capacity: int, period: float):
+        """
+        Initializes the bucket full.
+
+        Args:
+            capacity (int): Maximum number of tokens (burst size).
+            period (float): Time in seconds over which the full capacity refills.
+        """
+        self.capacity = capacity
+        self.period = period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """
+        Takes one token, sleeping until one becomes available if the bucket is empty.
+        """
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.capacity / self.period)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) * self.period / self.capacity)
+
+
 class TelegramNotifier:
     """
-    A class to send notifications to a Telegram chat.
+    A class to send notifications to a Telegram chat without blocking the caller.
     """
 
+    # Message layout with the constant postscript baked in; only the title and
+    # body are interpolated per send.
+    _TEMPLATE = "<b>%s</b>\n\n%s\n\n<b>Your faithful employee,\nTeleUPS</b>"
+
     def __init__(self, token_id: str, chat_id: str, logger: Optional[logging.Logger] = None):
         """
         Initializes the TelegramNotifier.
@@ -18,22 +60,50 @@ class TelegramNotifier:
         """
         self.token_id = token_id
         self.chat_id = chat_id
-        self.logger = logger or logging.getLogger(__name__)
+        self.logger = logger or _LOG
+        # Bind the log method once; the per-call wrapper and its branch are not needed.
+        self.log = self.logger.log
 
-    def handle_logging(self, level: int, message: str) -> None:
+        # The endpoint and everything but the message text are fixed per bot/chat,
+        # so build them once instead of on every send.
+        self._url = f"https://api.telegram.org/bot{token_id}/sendMessage"
+        self._payload_base = {
+            'chat_id': chat_id,
+            'parse_mode': 'HTML'
+        }
+
+        # Bound the worst case per send so a network hiccup cannot hang a
+        # notification task indefinitely.
+        self._timeout = aiohttp.ClientTimeout(connect=3, sock_read=10)
+
+        # The aiohttp session is created lazily on the first send so it is bound
+        # to the running event loop; it is reused across sends for keep-alive.
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Keep strong references to in-flight tasks so they are not garbage
+        # collected before the POST completes.
+        self._tasks = set()
+
+        # Self-throttle below Telegram's flood limits (~30 msgs/s overall,
+        # ~20 msgs/min per group) so a flapping UPS cannot trigger 429 storms.
+        self._global_bucket = _TokenBucket(capacity=30, period=1.0)
+        self._chat_bucket = _TokenBucket(capacity=20, period=60.0)
+
+    def notify(self, msg_title: str, msg: str) -> None:
         """
-        Handles logging or printing messages based on the availability of a logger.
+        Schedules a notification send without waiting for the HTTP round trip.
+
+        The POST runs as a background task on the current event loop, so the
+        monitoring loop keeps polling while the message is in flight.
 
         Args:
-            level (int): The log level for the message.
-            message (str): The message to log or print.
+            msg_title (str): The title of the message.
+            msg (str): The body of the message.
         """
-        if self.logger:
-            self.logger.log(level, message)
-        else:
-            print(message)
+        task = asyncio.create_task(self.send_notification(msg_title, msg))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
-    def send_notification(self, msg_title: str, msg: str) -> None:
+    async def send_notification(self, msg_title: str, msg: str) -> None:
         """
         Sends a notification to the specified Telegram chat.
 
@@ -41,17 +111,36 @@ class TelegramNotifier:
             msg_title (str): The title of the message.
             msg (str): The body of the message.
         """
-        post_msg = "Your faithful employee,\nTeleUPS"
-        full_msg = f"<b>{msg_title}</b>\n\n{msg}\n\n<b>{post_msg}</b>"
-        payload = {
-            'chat_id': self.chat_id,
-            'text': full_msg,
-            'parse_mode': 'HTML'
-        }
-        url = f"https://api.telegram.org/bot{self.token_id}/sendMessage"
+        full_msg = self._TEMPLATE % (msg_title, msg)
+        payload = {**self._payload_base, 'text': full_msg}
+        url = self._url
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=self._timeout)
         try:
-            response = requests.post(url, data=payload)
-            response.raise_for_status()
-            self.handle_logging(logging.INFO, "Telegram notification has been sent successfully")
-        except requests.exceptions.RequestException as e:
-            self.handle_logging(logging.ERROR, f"Failed to send Telegram notification: {e}")
+            for attempt in range(2):
+                await self._global_bucket.acquire()
+                await self._chat_bucket.acquire()
+                async with self._session.post(url, data=payload) as response:
+                    if response.status == 429 and attempt == 0:
+                        # Honor Telegram's flood-control hint before retrying once.
+                        body = await response.json()
+                        retry_after = body.get('parameters', {}).get('retry_after', 1)
+                        self.log(logging.WARNING, f"Telegram flood limit hit, retrying in {retry_after}s")
+                        await asyncio.sleep(retry_after)
+                        continue
+                    response.raise_for_status()
+                self.log(logging.INFO, "Telegram notification has been sent successfully")
+                return
+        except asyncio.TimeoutError:
+            self.log(logging.ERROR, "Telegram notification timed out")
+        except aiohttp.ClientError as e:
+            self.log(logging.ERROR, f"Failed to send Telegram notification: {e}")
+
+    async def close(self) -> None:
+        """
+        Waits for in-flight notifications and closes the HTTP session.
+        """
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
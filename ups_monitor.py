@@ -1,12 +1,21 @@
-import time
+import asyncio
 import logging
 from typing import Optional
 
+# Fallback logger resolved once at import so each monitor instance does not
+# repeat the getLogger lookup.
+_LOG = logging.getLogger(__name__)
+
 class UPSMonitor:
     """
     A class to monitor UPS status and send notifications for power outages and restorations.
     """
 
+    # Poll quickly while on battery, where seconds matter for low-battery
+    # detection, and slowly on mains power, where the state changes rarely.
+    FAST_POLL_INTERVAL = 1
+    SLOW_POLL_INTERVAL = 15
+
     def __init__(self, nut_client, telegram_notifier, logger: Optional[logging.Logger] = None):
         """
         Initializes the UPSMonitor.
@@ -20,77 +29,91 @@ class UPSMonitor:
         self.last_ups_on_battery_status = False
         self.last_ups_low_battery_status = False
         self.telegram_notifier = telegram_notifier
-        self.logger = logger or logging.getLogger(__name__)
-        self.handle_logging(logging.INFO, "Monitor started")
-
-    def handle_logging(self, level: int, message: str) -> None:
-        """
-        Handles logging or printing messages based on the availability of a logger.
-
-        Args:
-            level (int): The log level for the message.
-            message (str): The message to log or print.
-        """
-        if self.logger:
-            self.logger.log(level, message)
-        else:
-            print(message)
+        self.logger = logger or _LOG
+        # Bind the log method once; the per-call wrapper and its branch are not needed.
+        self.log = self.logger.log
+        self.log(logging.INFO, "Monitor started")
 
-    def send_ups_status_notification(self, title: str = "") -> None:
+    async def send_ups_status_notification(self, title: str = "", ups_vars: Optional[dict] = None,
+                                           ups_rwvars: Optional[dict] = None) -> None:
         """
         Sends a UPS status notification via Telegram.
 
         Args:
             title (str): The title of the notification message.
+            ups_vars (Optional[dict]): A pre-fetched UPS vars snapshot to build the message
+                from. Fetched from the NUT client if not provided.
+            ups_rwvars (Optional[dict]): A pre-fetched read-write vars snapshot. Fetched
+                from the NUT client if not provided.
         """
+        if ups_vars is None:
+            ups_vars = await asyncio.to_thread(self.nut_client.get_ups_vars)
+        if ups_rwvars is None:
+            ups_rwvars = await asyncio.to_thread(self.nut_client.get_ups_read_write_vars)
+
+        is_battery_low = self.nut_client.is_ups_battery_low(True, ups_vars=ups_vars, ups_rwvars=ups_rwvars)
         title = title + "\n" + "UPS Status Information"
-        msg = f"Battery Percentage: <b>{self.nut_client.get_battery_charge_percentage()}%</b>\n"
-        msg += f"Status: <b>{self.nut_client.get_ups_status()}</b>\n"
-        msg += f"Low Battery: <b>{'Yes' if self.nut_client.is_ups_battery_low(True) else 'No'}</b>\n"
-        msg += f"Power: <b>{self.nut_client.get_current_power_draw()} watt</b>"
-        self.telegram_notifier.send_notification(title, msg)
-        self.handle_logging(logging.INFO, "UPS status notification sent")
-
-    def handle_power_outage(self) -> None:
+        msg = f"Battery Percentage: <b>{self.nut_client.get_battery_charge_percentage(ups_vars=ups_vars)}%</b>\n"
+        msg += f"Status: <b>{self.nut_client.get_ups_status(ups_vars=ups_vars)}</b>\n"
+        msg += f"Low Battery: <b>{'Yes' if is_battery_low else 'No'}</b>\n"
+        msg += f"Power: <b>{self.nut_client.get_current_power_draw(ups_vars=ups_vars)} watt</b>"
+        self.telegram_notifier.notify(title, msg)
+        self.log(logging.INFO, "UPS status notification scheduled")
+
+    async def handle_power_outage(self, ups_vars: dict) -> None:
         """
         Handles the UPS power outage scenario.
+
+        Args:
+            ups_vars (dict): The UPS vars snapshot fetched for the current tick.
         """
-        self.handle_logging(logging.INFO, "UPS status changed (Power Outage)")
-        self.send_ups_status_notification(title="Power outage!")
+        self.log(logging.INFO, "UPS status changed (Power Outage)")
 
-        current_battery_perc = self.nut_client.get_battery_charge_percentage()
-        current_ups_low_battery_status = self.nut_client.is_ups_battery_low()
+        ups_rwvars = await asyncio.to_thread(self.nut_client.get_ups_read_write_vars)
+        current_battery_perc = self.nut_client.get_battery_charge_percentage(ups_vars=ups_vars)
+        current_ups_low_battery_status = self.nut_client.is_ups_battery_low(ups_vars=ups_vars, ups_rwvars=ups_rwvars)
 
+        # Coalesce the outage and low-battery alerts into a single message so a
+        # simultaneous trigger costs one Telegram POST instead of two.
+        titles = ["Power outage!"]
         if current_ups_low_battery_status and not self.last_ups_low_battery_status:
-            self.handle_logging(logging.INFO, f"Low battery status {current_battery_perc}%")
-            self.send_ups_status_notification(title="Low battery!")
+            self.log(logging.INFO, f"Low battery status {current_battery_perc}%")
+            titles.append("Low battery!")
 
+        await self.send_ups_status_notification(title="\n".join(titles), ups_vars=ups_vars, ups_rwvars=ups_rwvars)
         self.last_ups_low_battery_status = current_ups_low_battery_status
 
-    def handle_power_restoration(self) -> None:
+    async def handle_power_restoration(self, ups_vars: dict) -> None:
         """
         Handles the UPS power restoration scenario.
+
+        Args:
+            ups_vars (dict): The UPS vars snapshot fetched for the current tick.
         """
-        self.handle_logging(logging.INFO, "UPS status changed (Power Restoration)")
-        self.send_ups_status_notification(title="Power restoration!")
+        self.log(logging.INFO, "UPS status changed (Power Restoration)")
+        await self.send_ups_status_notification(title="Power restoration!", ups_vars=ups_vars)
 
-    def monitor_ups(self) -> None:
+    async def monitor_ups(self) -> None:
         """
         Monitors the UPS status in a loop and handles power outage/restoration events.
+
+        Runs as a coroutine so notification sends can overlap with polling.
         """
         try:
             while True:
-                current_ups_on_battery_status = self.nut_client.is_ups_on_battery()
+                ups_vars = await asyncio.to_thread(self.nut_client.get_ups_vars)
+                current_ups_on_battery_status = self.nut_client.is_ups_on_battery(ups_vars=ups_vars)
 
                 # Power outage
                 if not self.last_ups_on_battery_status and current_ups_on_battery_status:
-                    self.handle_power_outage()
+                    await self.handle_power_outage(ups_vars)
                 # Power restoration
                 elif self.last_ups_on_battery_status and not current_ups_on_battery_status:
-                    self.handle_power_restoration()
+                    await self.handle_power_restoration(ups_vars)
 
                 self.last_ups_on_battery_status = current_ups_on_battery_status
-                time.sleep(2)  # Wait for 2 seconds before checking again
+                interval = self.FAST_POLL_INTERVAL if current_ups_on_battery_status else self.SLOW_POLL_INTERVAL
+                await asyncio.sleep(interval)  # Wait before checking again
 
-        except KeyboardInterrupt:
-            self.handle_logging(logging.INFO, "Script terminated by user.")
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            self.log(logging.INFO, "Script terminated by user.")